@@ -6,32 +6,43 @@ import numpy as np
 
 GRIB_FILE = "Tests/SwiftGribTests/Resources/PWAI_WRCTP_50k_15d_3h_-31N_-44S_157E_145W_20260201_0540.grb"
 
+# Upper bin edges for the 8-point compass; 'N' appears at both ends to cover wraparound
+COMPASS_EDGES = np.array([22.5, 67.5, 112.5, 157.5, 202.5, 247.5, 292.5, 337.5])
+COMPASS_NAMES = np.array(['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW', 'N'])
+
 def calc_wind_direction(u, v):
     """Calculate meteorological wind direction (where wind comes FROM)."""
-    speed = np.sqrt(u**2 + v**2)
+    # float32 is ample for the 4-decimal wind output printed here
+    u = np.asarray(u, dtype=np.float32)
+    v = np.asarray(v, dtype=np.float32)
+    speed = np.hypot(u, v)
     # Meteorological convention: direction wind is coming FROM
-    direction = np.degrees(np.arctan2(-u, -v))
-    direction = np.where(direction < 0, direction + 360, direction)
+    # (asarray keeps scalar inputs writable for the in-place wrap below;
+    # 0 - u rather than -u so a zero component gives 0.0°, not -0.0°)
+    direction = np.asarray(np.degrees(np.arctan2(0 - u, 0 - v)))
+    direction[direction < 0] += 360
     return speed, direction
 
-grbs = pygrib.open(GRIB_FILE)
-
-# Get first U and V messages (message 2 and 3)
-grbs.seek(0)
-messages = list(grbs)
-
-# Find first U and V at same time
-u_msg = None
-v_msg = None
-for msg in messages:
-    if msg.shortName == '10u' or 'U-component' in str(msg):
-        if u_msg is None:
-            u_msg = msg
-    elif msg.shortName == '10v' or 'V-component' in str(msg):
-        if v_msg is None:
-            v_msg = msg
-    if u_msg and v_msg:
-        break
+def compass_point(direction):
+    """Map direction(s) in degrees to 8-point compass names."""
+    return COMPASS_NAMES[np.searchsorted(COMPASS_EDGES, direction, side='right')]
+
+def to_cartesian(lat, lon):
+    """Project lat/lon (degrees) onto the unit sphere so chord distance tracks great-circle distance."""
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    return np.column_stack([
+        np.cos(lat) * np.cos(lon),
+        np.cos(lat) * np.sin(lon),
+        np.sin(lat),
+    ])
+
+# Get first U and V messages (message 2 and 3) via an ecCodes index,
+# so only the selected messages are decoded
+grbindx = pygrib.index(GRIB_FILE, 'shortName')
+u_msg = grbindx.select(shortName='10u')[0]
+v_msg = grbindx.select(shortName='10v')[0]
+grbindx.close()
 
 print(f"U message: {u_msg}")
 print(f"V message: {v_msg}")
@@ -50,9 +61,8 @@ print("="*80)
 print(f"{'Idx':>4} {'U (m/s)':>10} {'V (m/s)':>10} {'Speed':>10} {'Dir FROM':>10}")
 print("-"*50)
 
-for i in range(10):
-    u, v = u_vals[i], v_vals[i]
-    speed, direction = calc_wind_direction(u, v)
+speeds, directions = calc_wind_direction(u_vals[:10], v_vals[:10])
+for i, (u, v, speed, direction) in enumerate(zip(u_vals[:10], v_vals[:10], speeds, directions)):
     print(f"{i:>4} {u:>10.4f} {v:>10.4f} {speed:>10.4f} {direction:>10.1f}°")
 
 # Find point near Sydney (-33.87, 151.21)
@@ -70,8 +80,10 @@ lons_flat = lons.flatten()
 
 # Find closest point to Sydney
 sydney_lat, sydney_lon = -34.0, 151.0
-distances = np.sqrt((lats_flat - sydney_lat)**2 + (lons_flat - sydney_lon)**2)
-sydney_idx = np.argmin(distances)
+# Chord distance on the unit sphere handles longitude wraparound; sqrt is
+# monotonic, so argmin of the squared distance picks the same point
+offsets = to_cartesian(lats_flat, lons_flat) - to_cartesian(sydney_lat, sydney_lon)
+sydney_idx = int(np.argmin(np.einsum('ij,ij->i', offsets, offsets)))
 
 print(f"Closest grid point to Sydney: index {sydney_idx}")
 print(f"  Lat: {lats_flat[sydney_idx]:.2f}, Lon: {lons_flat[sydney_idx]:.2f}")
@@ -86,22 +98,7 @@ print(f"  Speed: {speed_sydney:.2f} m/s ({speed_sydney * 1.94384:.1f} kts)")
 print(f"  Direction: {dir_sydney:.1f}° (wind coming FROM)")
 
 # Direction interpretation
-if 337.5 <= dir_sydney or dir_sydney < 22.5:
-    compass = "N"
-elif 22.5 <= dir_sydney < 67.5:
-    compass = "NE"
-elif 67.5 <= dir_sydney < 112.5:
-    compass = "E"
-elif 112.5 <= dir_sydney < 157.5:
-    compass = "SE"
-elif 157.5 <= dir_sydney < 202.5:
-    compass = "S"
-elif 202.5 <= dir_sydney < 247.5:
-    compass = "SW"
-elif 247.5 <= dir_sydney < 292.5:
-    compass = "W"
-else:
-    compass = "NW"
+compass = compass_point(dir_sydney)
 
 print(f"  Compass: {compass} wind")
 
@@ -109,24 +106,25 @@ print(f"  Compass: {compass} wind")
 dir_to = (dir_sydney + 180) % 360
 print(f"  Wind blowing TOWARDS: {dir_to:.1f}°")
 
-grbs.close()
-
 # Test specific U/V combinations
 print("\n" + "="*80)
 print("UNIT TESTS - DIRECTION CALCULATION")
 print("="*80)
 print("Testing standard cases:")
-test_cases = [
-    (0, -1, "Wind FROM North (blowing south)"),
-    (1, 0, "Wind FROM West (blowing east)"),
-    (0, 1, "Wind FROM South (blowing north)"),
-    (-1, 0, "Wind FROM East (blowing west)"),
-    (1, -1, "Wind FROM NW (blowing SE)"),
-    (-1, -1, "Wind FROM NE (blowing SW)"),
-    (-1, 1, "Wind FROM SE (blowing NW)"),
-    (1, 1, "Wind FROM SW (blowing NE)"),
+u_arr = np.array([0, 1, 0, -1, 1, -1, -1, 1], dtype=np.float32)
+v_arr = np.array([-1, 0, 1, 0, -1, -1, 1, 1], dtype=np.float32)
+descs = [
+    "Wind FROM North (blowing south)",
+    "Wind FROM West (blowing east)",
+    "Wind FROM South (blowing north)",
+    "Wind FROM East (blowing west)",
+    "Wind FROM NW (blowing SE)",
+    "Wind FROM NE (blowing SW)",
+    "Wind FROM SE (blowing NW)",
+    "Wind FROM SW (blowing NE)",
 ]
 
-for u, v, desc in test_cases:
-    speed, direction = calc_wind_direction(u, v)
-    print(f"  U={u:>2}, V={v:>2} -> Dir={direction:>6.1f}° : {desc}")
+speeds, directions = calc_wind_direction(u_arr, v_arr)
+compasses = compass_point(directions)
+for u, v, direction, compass, desc in zip(u_arr, v_arr, directions, compasses, descs):
+    print(f"  U={u:>2.0f}, V={v:>2.0f} -> Dir={direction:>6.1f}° ({compass:>2}) : {desc}")
@@ -2,52 +2,135 @@
 """Compare pygrib and SwiftGrib outputs in detail."""
 
 import json
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Below this many allValues in total, worker start-up and pickling cost more
+# than the comparison itself (~0.1 s per 10M values serially)
+PARALLEL_MIN_VALUES = 50_000_000
+
+# JSON array starts with just '[' on its own line (possibly with whitespace);
+# build output such as "[0/3] Write ..." must not match
+JSON_START = re.compile(r'^[ \t]*\[[ \t\r]*$', re.MULTILINE)
 
 def load_json(filename):
-    """Load JSON, handling potential build output prefix."""
+    """Load JSON, handling potential build output prefix.
+    
+    allValues are returned as float64 arrays, which also pickle far more
+    compactly than lists of floats when sent to worker processes.
+    """
     with open(filename, 'r') as f:
         content = f.read()
     
-    # Find the start of JSON array - a line that is just '[' (possibly with whitespace)
-    lines = content.split('\n')
-    json_lines = []
-    found_json = False
-    
-    for line in lines:
-        stripped = line.strip()
-        if not found_json:
-            # JSON array starts with just '[' on its own line
-            if stripped == '[':
-                found_json = True
-                json_lines.append(line)
-        else:
-            json_lines.append(line)
+    match = JSON_START.search(content)
+    if match is None:
+        raise ValueError(f"No JSON array found in {filename}")
+    json_content = content[match.start():]
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.loads(json_content)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals from json.dumps, which orjson rejects
+    if data is None:
+        data = json.loads(json_content)
     
-    json_content = '\n'.join(json_lines)
-    return json.loads(json_content)
+    for msg in data:
+        if "allValues" in msg:
+            msg["allValues"] = np.asarray(msg["allValues"], dtype=np.float64)
+    return data
 
 def compare_values(pygrib_vals, swift_vals, tolerance=1e-6):
     """Compare two lists of values with tolerance."""
-    if len(pygrib_vals) != len(swift_vals):
-        return False, f"Length mismatch: {len(pygrib_vals)} vs {len(swift_vals)}"
-    
-    max_diff = 0
-    max_diff_idx = 0
-    diffs = []
-    
-    for i, (pv, sv) in enumerate(zip(pygrib_vals, swift_vals)):
-        diff = abs(pv - sv)
-        if diff > max_diff:
-            max_diff = diff
-            max_diff_idx = i
-        if diff > tolerance:
-            diffs.append((i, pv, sv, diff))
-    
-    if diffs:
-        return False, f"Max diff {max_diff:.10f} at index {max_diff_idx}, {len(diffs)} values differ"
+    a = np.asarray(pygrib_vals, dtype=np.float64)
+    b = np.asarray(swift_vals, dtype=np.float64)
+    if a.shape != b.shape:
+        return False, f"Length mismatch: {len(a)} vs {len(b)}"
+    if a.size == 0:
+        return True, f"Max diff {0:.10e}"
+    
+    diffs = np.abs(a - b)
+    max_diff_idx = int(diffs.argmax())
+    max_diff = diffs[max_diff_idx]
+    bad = np.flatnonzero(diffs > tolerance)
+    
+    if bad.size:
+        return False, f"Max diff {max_diff:.10f} at index {max_diff_idx}, {bad.size} values differ"
     return True, f"Max diff {max_diff:.10e}"
 
+def compare_message(job):
+    """Compare one (message number, pygrib, SwiftGrib) message triple.
+    
+    Returns (match, output lines, [(issue category, description), ...]) so
+    messages can be compared in worker processes and reported in order.
+    """
+    msg_num, pg, sg = job
+    match = True
+    out = []
+    issues = []
+    
+    # Compare all values if available
+    if "allValues" in pg and "allValues" in sg:
+        match, detail = compare_values(pg["allValues"], sg["allValues"])
+        if not match:
+            issues.append(("values", f"Msg {msg_num} ({pg['parameterName']}): {detail}"))
+            out.append(f"[FAIL] Message {msg_num}: VALUES MISMATCH")
+            out.append(f"       Parameter: {pg['parameterName']}")
+            out.append(f"       {detail}")
+            
+            # Show first few mismatches
+            pg_vals = pg["allValues"]
+            sg_vals = sg["allValues"]
+            out.append(f"       First 5 values comparison:")
+            for j in range(min(5, len(pg_vals))):
+                pv, sv = pg_vals[j], sg_vals[j]
+                diff = abs(pv - sv)
+                status = "✓" if diff < 1e-6 else "✗"
+                out.append(f"         [{j}] pygrib: {pv:.10f}, swift: {sv:.10f}, diff: {diff:.2e} {status}")
+            out.append("")
+        else:
+            out.append(f"[OK]   Message {msg_num}: {pg['parameterName'][:30]:30} {detail}")
+    else:
+        # Compare first10/last10
+        if "first10" in pg and "first10" in sg:
+            match1, detail1 = compare_values(pg["first10"], sg["first10"])
+            match2, detail2 = compare_values(pg["last10"], sg["last10"])
+            match = match1 and match2
+            if not match:
+                issues.append(("values", f"Msg {msg_num}: first10/last10 mismatch"))
+                out.append(f"[FAIL] Message {msg_num}: {pg['parameterName'][:30]:30}")
+                if not match1:
+                    out.append(f"       First10: {detail1}")
+                if not match2:
+                    out.append(f"       Last10: {detail2}")
+            else:
+                out.append(f"[OK]   Message {msg_num}: {pg['parameterName'][:30]:30} (sampled)")
+    
+    # Compare statistics
+    if abs(pg["min"] - sg["min"]) > 1e-6:
+        issues.append(("values", f"Msg {msg_num}: min value differs: {pg['min']} vs {sg['min']}"))
+    if abs(pg["max"] - sg["max"]) > 1e-6:
+        issues.append(("values", f"Msg {msg_num}: max value differs: {pg['max']} vs {sg['max']}"))
+    if abs(pg["mean"] - sg["mean"]) > 1e-4:
+        issues.append(("values", f"Msg {msg_num}: mean value differs: {pg['mean']} vs {sg['mean']}"))
+    
+    # Compare grid
+    if pg.get("Ni") != sg.get("Ni") or pg.get("Nj") != sg.get("Nj"):
+        issues.append(("grid", f"Msg {msg_num}: grid size differs"))
+    
+    # Compare parameter ID
+    if pg.get("indicatorOfParameter") != sg.get("indicatorOfParameter"):
+        issues.append(("metadata", f"Msg {msg_num}: parameter ID differs: {pg.get('indicatorOfParameter')} vs {sg.get('indicatorOfParameter')}"))
+    
+    return match, out, issues
+
 def main():
     print("=" * 70)
     print("PYGRIB vs SWIFTGRIB DEEP COMPARISON")
@@ -75,64 +158,21 @@ def main():
     
     all_match = True
     
-    for i in range(len(pygrib_data)):
-        pg = pygrib_data[i]
-        sg = swift_data[i]
-        msg_num = i + 1
-        
-        # Compare all values if available
-        if "allValues" in pg and "allValues" in sg:
-            match, detail = compare_values(pg["allValues"], sg["allValues"])
-            if not match:
-                all_match = False
-                issues["values"].append(f"Msg {msg_num} ({pg['parameterName']}): {detail}")
-                print(f"[FAIL] Message {msg_num}: VALUES MISMATCH")
-                print(f"       Parameter: {pg['parameterName']}")
-                print(f"       {detail}")
-                
-                # Show first few mismatches
-                pg_vals = pg["allValues"]
-                sg_vals = sg["allValues"]
-                print(f"       First 5 values comparison:")
-                for j in range(min(5, len(pg_vals))):
-                    pv, sv = pg_vals[j], sg_vals[j]
-                    diff = abs(pv - sv)
-                    status = "✓" if diff < 1e-6 else "✗"
-                    print(f"         [{j}] pygrib: {pv:.10f}, swift: {sv:.10f}, diff: {diff:.2e} {status}")
-                print()
-            else:
-                print(f"[OK]   Message {msg_num}: {pg['parameterName'][:30]:30} {detail}")
-        else:
-            # Compare first10/last10
-            if "first10" in pg and "first10" in sg:
-                match1, detail1 = compare_values(pg["first10"], sg["first10"])
-                match2, detail2 = compare_values(pg["last10"], sg["last10"])
-                if not (match1 and match2):
-                    all_match = False
-                    issues["values"].append(f"Msg {msg_num}: first10/last10 mismatch")
-                    print(f"[FAIL] Message {msg_num}: {pg['parameterName'][:30]:30}")
-                    if not match1:
-                        print(f"       First10: {detail1}")
-                    if not match2:
-                        print(f"       Last10: {detail2}")
-                else:
-                    print(f"[OK]   Message {msg_num}: {pg['parameterName'][:30]:30} (sampled)")
-        
-        # Compare statistics
-        if abs(pg["min"] - sg["min"]) > 1e-6:
-            issues["values"].append(f"Msg {msg_num}: min value differs: {pg['min']} vs {sg['min']}")
-        if abs(pg["max"] - sg["max"]) > 1e-6:
-            issues["values"].append(f"Msg {msg_num}: max value differs: {pg['max']} vs {sg['max']}")
-        if abs(pg["mean"] - sg["mean"]) > 1e-4:
-            issues["values"].append(f"Msg {msg_num}: mean value differs: {pg['mean']} vs {sg['mean']}")
-        
-        # Compare grid
-        if pg.get("Ni") != sg.get("Ni") or pg.get("Nj") != sg.get("Nj"):
-            issues["grid"].append(f"Msg {msg_num}: grid size differs")
-        
-        # Compare parameter ID
-        if pg.get("indicatorOfParameter") != sg.get("indicatorOfParameter"):
-            issues["metadata"].append(f"Msg {msg_num}: parameter ID differs: {pg.get('indicatorOfParameter')} vs {sg.get('indicatorOfParameter')}")
+    jobs = zip(range(1, len(pygrib_data) + 1), pygrib_data, swift_data)
+    total_values = sum(len(pg["allValues"]) for pg in pygrib_data if "allValues" in pg)
+    if total_values >= PARALLEL_MIN_VALUES:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(compare_message, jobs, chunksize=8))
+    else:
+        results = map(compare_message, jobs)
+    
+    for match, out, msg_issues in results:
+        if not match:
+            all_match = False
+        for line in out:
+            print(line)
+        for category, item in msg_issues:
+            issues[category].append(item)
     
     print("\n" + "=" * 70)
     print("SUMMARY")
@@ -221,12 +261,14 @@ def main():
         print(f"\n{'Index':>6} {'Pygrib':>18} {'SwiftGrib':>18} {'Diff':>15} {'Match':>6}")
         print("-" * 65)
         
-        for j in range(min(20, len(pg["allValues"]))):
-            pv = pg["allValues"][j]
-            sv = sg["allValues"][j]
-            diff = abs(pv - sv)
-            match = "✓" if diff < 1e-6 else "✗"
-            print(f"{j:>6} {pv:>18.9f} {sv:>18.9f} {diff:>15.2e} {match:>6}")
+        pv = np.asarray(pg["allValues"][:20], dtype=np.float64)
+        sv = np.asarray(sg["allValues"][:len(pv)], dtype=np.float64)
+        diff = np.abs(pv - sv)
+        ok = diff < 1e-6
+        print("\n".join(
+            f"{j:>6} {p:>18.9f} {s:>18.9f} {d:>15.2e} {'✓' if k else '✗':>6}"
+            for j, (p, s, d, k) in enumerate(zip(pv, sv, diff, ok))
+        ))
 
 if __name__ == "__main__":
     main()
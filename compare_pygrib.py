@@ -3,8 +3,14 @@
 
 import pygrib
 import json
+import math
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 GRIB_FILE = "Tests/SwiftGribTests/Resources/PWAI_WRCTP_50k_15d_3h_-31N_-44S_157E_145W_20260201_0540.grb"
 
 def safe_get(grb, attr, default=None):
@@ -14,10 +20,24 @@ def safe_get(grb, attr, default=None):
     except (RuntimeError, KeyError, AttributeError):
         return default
 
+def dumps_message(info):
+    """Serialize one message's info dict as indented JSON."""
+    # orjson writes NaN/inf as null; any non-finite value also makes the
+    # stats non-finite, so those messages keep the stdlib NaN/Infinity literals
+    finite = all(math.isfinite(info[key]) for key in ("min", "max", "mean"))
+    if orjson is not None and finite:
+        return orjson.dumps(info, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(info, indent=2)
+
 def main():
     grbs = pygrib.open(GRIB_FILE)
     
-    results = []
+    # Output as JSON for easy parsing, one message at a time so only the
+    # current message's values are held in memory
+    sys.stdout.write("[\n")
+    
+    # Grid geometry rarely changes between messages, so project each grid once
+    grid_cache = {}
     
     for i, grb in enumerate(grbs):
         msg_num = i + 1
@@ -54,38 +74,50 @@ def main():
         info["jDirectionIncrement"] = safe_get(grb, 'jDirectionIncrementInDegrees')
         
         # Get values
-        values = grb.values.flatten()
-        info["numValues"] = len(values)
+        values = grb.values.ravel()
+        total = values.size
+        info["numValues"] = total
         info["min"] = float(values.min())
         info["max"] = float(values.max())
         info["mean"] = float(values.mean())
         
         # Get first 10 and last 10 values for detailed comparison
-        info["first10"] = [float(v) for v in values[:10]]
-        info["last10"] = [float(v) for v in values[-10:]]
+        info["first10"] = values[:10].tolist()
+        info["last10"] = values[-10:].tolist()
         
         # Get all values for complete comparison (for first few messages of each type)
         if msg_num <= 5 or (msg_num - 1) % 51 < 2:  # First 5, plus first 2 of each param type
-            info["allValues"] = [float(v) for v in values]
+            info["allValues"] = values.tolist()
         
-        # Get values at specific indices for spot checks
-        total = len(values)
+        # Get values at specific indices for spot checks (gathered in one go)
         spot_indices = [0, 1, 2, total//4, total//2, 3*total//4, total-3, total-2, total-1]
-        info["spotValues"] = {str(idx): float(values[idx]) for idx in spot_indices}
+        spot_values = values[spot_indices].tolist()
+        info["spotValues"] = {str(idx): v for idx, v in zip(spot_indices, spot_values)}
         
-        # Get lats/lons
-        lats, lons = grb.latlons()
-        info["firstLat"] = float(lats.flatten()[0])
-        info["firstLon"] = float(lons.flatten()[0])
-        info["lastLat"] = float(lats.flatten()[-1])
-        info["lastLon"] = float(lons.flatten()[-1])
+        # Get lats/lons, keyed on the hash of the grid definition section
+        # (md5GridSection covers Section 2 in GRIB1 and Section 3 in GRIB2);
+        # without one, don't risk reusing another grid's coordinates
+        grid_key = safe_get(grb, 'md5GridSection')
+        if grid_key is None or grid_key not in grid_cache:
+            lats, lons = grb.latlons()
+            lats, lons = lats.ravel(), lons.ravel()
+            if grid_key is not None:
+                grid_cache[grid_key] = (lats, lons)
+        else:
+            lats, lons = grid_cache[grid_key]
+        info["firstLat"] = float(lats[0])
+        info["firstLon"] = float(lons[0])
+        info["lastLat"] = float(lats[-1])
+        info["lastLon"] = float(lons[-1])
         
-        results.append(info)
+        if i > 0:
+            sys.stdout.write(",\n")
+        sys.stdout.write(dumps_message(info))
+        del info, values
     
     grbs.close()
     
-    # Output as JSON for easy parsing
-    print(json.dumps(results, indent=2))
+    sys.stdout.write("\n]\n")
 
 if __name__ == "__main__":
     main()
@@ -2,24 +2,21 @@
 """Verify wind direction output from SwiftGrib matches expected."""
 
 import json
+import re
 import numpy as np
 
+# JSON array starts with just '[' on its own line (possibly with whitespace);
+# build output such as "[0/3] Write ..." must not match
+JSON_START = re.compile(r'^[ \t]*\[[ \t\r]*$', re.MULTILINE)
+
 def load_json(filename):
     """Load JSON, handling potential build output prefix."""
     with open(filename, 'r') as f:
         content = f.read()
-    lines = content.split('\n')
-    json_lines = []
-    found_json = False
-    for line in lines:
-        stripped = line.strip()
-        if not found_json:
-            if stripped == '[':
-                found_json = True
-                json_lines.append(line)
-        else:
-            json_lines.append(line)
-    return json.loads('\n'.join(json_lines))
+    match = JSON_START.search(content)
+    if match is None:
+        raise ValueError(f"No JSON array found in {filename}")
+    return json.loads(content[match.start():])
 
 # Load SwiftGrib output
 swift_data = load_json("swiftgrib_output.json")
@@ -45,6 +42,16 @@ print("="*60)
 u_vals = u_msg.get("allValues") or u_msg.get("first10")
 v_vals = v_msg.get("allValues") or v_msg.get("first10")
 
+# U and V may differ in length (allValues vs first10), so pair them up first.
+# SwiftGrib values are Float, so float32 holds them exactly
+n = min(len(u_vals), len(v_vals))
+u_arr = np.asarray(u_vals[:n], dtype=np.float32)
+v_arr = np.asarray(v_vals[:n], dtype=np.float32)
+speeds = np.hypot(u_arr, v_arr)
+# 0 - u rather than -u so a zero component gives 0.0°, not -0.0°
+dirs = np.degrees(np.arctan2(0 - u_arr, 0 - v_arr))
+dirs[dirs < 0] += 360
+
 print(f"U message param: {u_msg.get('parameterName')}")
 print(f"V message param: {v_msg.get('parameterName')}")
 
@@ -53,23 +60,16 @@ print("\nFirst 10 points - Wind from SwiftGrib raw U/V:")
 print(f"{'Idx':>4} {'U':>10} {'V':>10} {'Speed':>10} {'Dir FROM':>10}")
 print("-"*50)
 
-for i in range(min(10, len(u_vals))):
-    u, v = u_vals[i], v_vals[i]
-    speed = np.sqrt(u**2 + v**2)
-    direction = np.degrees(np.arctan2(-u, -v))
-    if direction < 0:
-        direction += 360
-    print(f"{i:>4} {u:>10.4f} {v:>10.4f} {speed:>10.4f} {direction:>10.1f}°")
+for i in range(min(10, len(u_arr))):
+    print(f"{i:>4} {u_arr[i]:>10.4f} {v_arr[i]:>10.4f} {speeds[i]:>10.4f} {dirs[i]:>10.1f}°")
 
 # Check Sydney area (index 162 based on previous analysis)
 sydney_idx = 162
-if len(u_vals) > sydney_idx:
-    u_syd = u_vals[sydney_idx]
-    v_syd = v_vals[sydney_idx]
-    speed_syd = np.sqrt(u_syd**2 + v_syd**2)
-    dir_syd = np.degrees(np.arctan2(-u_syd, -v_syd))
-    if dir_syd < 0:
-        dir_syd += 360
+if len(u_arr) > sydney_idx:
+    u_syd = u_arr[sydney_idx]
+    v_syd = v_arr[sydney_idx]
+    speed_syd = speeds[sydney_idx]
+    dir_syd = dirs[sydney_idx]
     
     print(f"\nSydney area (index {sydney_idx}):")
     print(f"  U: {u_syd:.4f} m/s")